@@ -38,6 +38,7 @@ class Feature(object):
             if len(result.tracks) != 0:
                 first = list(result.tracks.values())[0]
                 first.properties.update(self.properties)
+                result.clear_cache()
             return result
         elif isinstance(other, CoverageStack):
             result = copy(other)
@@ -1,6 +1,11 @@
+import os
 import abc
 from typing import Union
-from collections import OrderedDict
+from functools import lru_cache
+from importlib import import_module
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter, methodcaller
+from collections import OrderedDict, deque
 from copy import copy
 
 from coolbox.utilities import (
@@ -13,8 +18,91 @@ log = get_logger(__name__)
 
 GR = Union[str, GenomeRange]
 
+# most track backends release the GIL while reading, fetch them concurrently.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4))
+
+
+@lru_cache(maxsize=256)
+def _parse_range(range_: str) -> tuple:
+    return GenomeRange.parse_region_string(range_)
+
+
+def _to_range(range_) -> GenomeRange:
+    """
+    Convert a genome range string to GenomeRange, the parsing of recurring strings is cached.
+    A new object is returned on every call, because GenomeRange can be changed in place.
+
+    >>> _to_range("chr1:1000-2000") is _to_range("chr1:1000-2000")
+    False
+    """
+    if isinstance(range_, str):
+        return GenomeRange(*_parse_range(range_))
+    return GenomeRange(range_)
+
+
+class _LazyImports(object):
+    """
+    Classes which can not be imported at module level because of circular imports.
+    Each one is imported on the first access, then stored as a plain attribute.
+    """
+
+    SOURCES = {
+        'Track': ('..track.base', 'Track'),
+        'BedGraph': ('..track', 'BedGraph'),
+        'BigWig': ('..track', 'BigWig'),
+        'Feature': ('..feature', 'Feature'),
+        'FrameFeature': ('..feature', 'FrameFeature'),
+        'Coverage': ('..coverage.base', 'Coverage'),
+        'CoverageStack': ('..coverage.base', 'CoverageStack'),
+        'WidgetsPanel': ('..browser', 'WidgetsPanel'),
+        'Browser': ('..browser', 'Browser'),
+    }
+
+    def __getattr__(self, name):
+        if name not in self.SOURCES:
+            raise AttributeError(name)
+        module, attr = self.SOURCES[name]
+        value = getattr(import_module(module, __package__), attr)
+        setattr(self, name, value)
+        return value
+
+
+_lazy = _LazyImports()
+
+# (track class, method name) -> whether the class has the method
+_METHODS_CACHE = {}
+
+
+def _has_method(track, name: str) -> bool:
+    """Same as `hasattr(track, name)`, but the answer is cached per track class."""
+    key = (type(track), name)
+    if key not in _METHODS_CACHE:
+        _METHODS_CACHE[key] = hasattr(track, name)
+    return _METHODS_CACHE[key]
+
 
 class FrameBase(abc.ABC):
+    """
+    Frame base class.
+
+    Attributes of FrameBase are stored in `__slots__`,
+    subclasses without their own `__slots__` still have a `__dict__` for the extra attributes.
+
+    Subclasses must provide the `tracks` attribute (a mapping from track name to track)
+    before calling `FrameBase.__init__`, as a plain attribute or a property.
+    """
+
+    __slots__ = (
+        'current_range', 'current_range2', 'properties',
+        '_fetch_cache', '_last_fetch', 'cache_size', 'parallel_fetch',
+    )
+
+    DEFAULT_CACHE_SIZE = 0
+
+    # operand type -> handler of `+`, see `FrameBase._get_add_handlers`
+    _ADD_HANDLERS = None
+    # track types which min and max value can be set by `set_tracks_min_max`, resolved on first use
+    _MINMAX_TYPES = None
 
     def __init__(self, properties_dict, *args, **kwargs):
         # init range
@@ -25,21 +113,37 @@ class FrameBase(abc.ABC):
             else:
                 # init from genome range string
                 # e.g. `frame = Frame(gr="chr1:1000-2000")`
-                self.current_range = GenomeRange(range_)
+                self.current_range = _to_range(range_)
         else:
             self.current_range = None
         if 'gr2' in kwargs:
             range_ = kwargs['gr2']
             if isinstance(range_, GenomeRange):
-                self.current_range = range_
+                self.current_range2 = range_
             else:
                 # init from genome range string
-                # e.g. `frame = Frame(gr="chr1:1000-2000")`
-                self.current_range = GenomeRange(range_)
+                # e.g. `frame = Frame(gr2="chr1:1000-2000")`
+                self.current_range2 = _to_range(range_)
         else:
             self.current_range2 = None
 
-        self.properties = properties_dict
+        # frame owns its properties, the dict passed in is never mutated.
+        self.properties = dict(properties_dict) if properties_dict else {}
+
+        # cache fetched data in a bounded LRU, speed up repeated queries of the same range.
+        # disabled by default, the cache can not see changes of tracks' properties,
+        # call `clear_cache` after changing them if it is enabled.
+        #   key: (id(track), gr, gr2)
+        #   value: (track, data)
+        self._fetch_cache = OrderedDict()
+        # key of the last `fetch_data` call: (range key, (track name, id(track)) pairs),
+        # the result is rebuilt from `_fetch_cache`, so only the key is kept here.
+        self._last_fetch = None
+        self.cache_size = FrameBase.DEFAULT_CACHE_SIZE
+        # fetch tracks data in threads, set to False for serial fetching.
+        self.parallel_fetch = True
+
+        assert hasattr(self, 'tracks'), f"{self.__class__.__name__} should set the `tracks` attribute."
 
     @abc.abstractmethod
     def plot(self):
@@ -49,15 +153,15 @@ class FrameBase(abc.ABC):
     def show(self):
         pass
 
-    @property
-    @abc.abstractmethod
-    def tracks(self):
-        pass
-
     @abc.abstractmethod
     def add_track(self, track):
         pass
 
+    @property
+    def _last_track(self):
+        """The tail track of this frame, None if the frame is empty."""
+        return next(reversed(self.tracks.values()), None)
+
     def goto(self, gr: GR = None, gr2: GR = None):
         """
         Go to the range on the genome.
@@ -80,9 +184,9 @@ class FrameBase(abc.ABC):
         'chr1:1000-2000'
         """
         if gr:
-            self.current_range = gr if isinstance(gr, GenomeRange) else GenomeRange(gr)
+            self.current_range = gr if isinstance(gr, GenomeRange) else _to_range(gr)
         if gr2:
-            self.current_range2 = gr if isinstance(gr2, GenomeRange) else GenomeRange(gr2)
+            self.current_range2 = gr2 if isinstance(gr2, GenomeRange) else _to_range(gr2)
 
     def fetch_data(self, gr: GR = None, gr2: GR = None):
         self.goto(gr, gr2)
@@ -90,26 +194,144 @@ class FrameBase(abc.ABC):
         if gr is None:
             raise ValueError("No GenomeRange history found.")
 
-        tracks_data = OrderedDict()
+        range_key = (tuple(gr), tuple(gr2) if gr2 is not None else None)
+        use_cache = self.cache_size > 0
+        if use_cache:
+            fetch_key = (range_key, tuple((name, id(track)) for name, track in self.tracks.items()))
+            if fetch_key == self._last_fetch:
+                tracks_data = self._rebuild_last_fetch(range_key)
+                if tracks_data is not None:
+                    return tracks_data
+
+        tracks_data = {}
+        # group the uncached tracks by their data source, each group is fetched in one pass.
+        groups = {}
         for name, track in self.tracks.items():
-            data = track.fetch_data(gr, gr2=gr2) if hasattr(track, 'fetch_data') else []
-            tracks_data.update([(name, data)])
+            if not _has_method(track, 'fetch_data'):
+                data = []
+            else:
+                key = (id(track),) + range_key
+                if use_cache and key in self._fetch_cache:
+                    self._fetch_cache.move_to_end(key)
+                    data = copy(self._fetch_cache[key][1])
+                else:
+                    data = None
+                    backend = (type(track), getattr(track, '_backend_key', id(track)))
+                    groups.setdefault(backend, []).append((name, track))
+            tracks_data[name] = data
+
+        groups = list(groups.values())
+        tracks_list = [[track for _, track in siblings] for siblings in groups]
+        # each group get its own GenomeRange, tracks may change chrom names in place.
+        if self.parallel_fetch and len(groups) > 1:
+            futures = [
+                _FETCH_POOL.submit(self._fetch_group, tracks, copy(gr), copy(gr2))
+                for tracks in tracks_list
+            ]
+            results = [future.result() for future in futures]
+        else:
+            results = [self._fetch_group(tracks, copy(gr), copy(gr2)) for tracks in tracks_list]
+
+        for siblings, group_data in zip(groups, results):
+            for (name, track), data in zip(siblings, group_data):
+                self._cache_data((id(track),) + range_key, track, data)
+                tracks_data[name] = data
+
+        if use_cache:
+            self._last_fetch = fetch_key
+        return tracks_data
 
+    def _rebuild_last_fetch(self, range_key):
+        """
+        Rebuild the result of the last `fetch_data` call from `_fetch_cache`,
+        None if any track's data has been evicted.
+        """
+        tracks_data = {}
+        for name, track in self.tracks.items():
+            if not _has_method(track, 'fetch_data'):
+                tracks_data[name] = []
+                continue
+            # the cached value holds the track, so a matched id is always the same track.
+            cached = self._fetch_cache.get((id(track),) + range_key)
+            if cached is None:
+                return None
+            tracks_data[name] = copy(cached[1])
         return tracks_data
 
+    def iter_fetch_data(self, gr: GR = None, gr2: GR = None):
+        """
+        Fetch data of tracks one by one, yield `(name, data)` pairs in the order of tracks.
+
+        Unlike `fetch_data`, the fetched data is not cached,
+        only one track's data need to be kept in memory if the consumer discard it after use.
+
+        Examples
+        --------
+        >>> from coolbox.core.track import XAxis
+        >>> frame = XAxis() + XAxis()
+        >>> [name for name, _ in frame.iter_fetch_data("chr1:1000-2000")] == list(frame.tracks)
+        True
+        """
+        self.goto(gr, gr2)
+        gr, gr2 = self.current_range, self.current_range2
+        if gr is None:
+            raise ValueError("No GenomeRange history found.")
+
+        # validate and go to the range now, the generator only runs when it's consumed.
+        return self._iter_fetch_data(gr, gr2)
+
+    def _iter_fetch_data(self, gr, gr2):
+        range_key = (tuple(gr), tuple(gr2) if gr2 is not None else None)
+        for name, track in self.tracks.items():
+            if not _has_method(track, 'fetch_data'):
+                yield name, []
+                continue
+            cached = self._fetch_cache.get((id(track),) + range_key) if self.cache_size > 0 else None
+            yield name, copy(cached[1]) if cached is not None else track.fetch_data(gr, gr2=gr2)
+
+    @staticmethod
+    def _fetch_group(tracks, gr, gr2):
+        """
+        Fetch data of tracks which share the same data source.
+
+        Tracks can implement `_batch_fetch(gr, tracks, gr2=None)` to read the source only once
+        and return a list of data in the same order as `tracks`.
+        """
+        if len(tracks) > 1 and _has_method(tracks[0], '_batch_fetch'):
+            return tracks[0]._batch_fetch(gr, tracks, gr2=gr2)
+        return [track.fetch_data(gr, gr2=gr2) for track in tracks]
+
+    def _cache_data(self, key, track, data):
+        if self.cache_size <= 0:
+            return
+        cache = self._fetch_cache
+        # keep a reference of track in value, so the id in key can not be reused.
+        # store and hand out copies, callers may change the returned data in place.
+        cache[key] = (track, copy(data))
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def clear_cache(self):
+        """
+        Clear the cached data of `fetch_data`.
+        Should be called after changing the properties which effect the fetched data of tracks.
+        """
+        self._fetch_cache.clear()
+        self._last_fetch = None
+
     def fetch_plot_data(self, gr: GR = None, gr2: GR = None):
         self.goto(gr, gr2)
         gr, gr2 = self.current_range, self.current_range2
         if gr is None:
             raise ValueError("No GenomeRange history found.")
 
-        tracks_data = OrderedDict()
+        tracks_data = {}
         for name, track in self.tracks.items():
-            if hasattr(track, 'fetch_plot_data'):
+            if _has_method(track, 'fetch_plot_data'):
                 data = track.fetch_plot_data(gr, gr2=gr2)
             else:
                 data = []
-            tracks_data.update([(name, data)])
+            tracks_data[name] = data
 
         return tracks_data
 
@@ -129,10 +351,11 @@ class FrameBase(abc.ABC):
         >>> frame.add_feature_to_tracks(Color('#66ccff'))
         >>> assert all([track.properties['color'] == '#66ccff' for track in frame.tracks.values()])
         """
-        from ..feature import Feature
-        assert isinstance(feature, Feature), "feature must a Feature object."
-        for track in self.tracks.values():
-            track.properties.update(feature.properties)
+        assert isinstance(feature, _lazy.Feature), "feature must a Feature object."
+        update = methodcaller('update', feature.properties)
+        # drain the iterator in C, the loop body is a single method call.
+        deque(map(update, map(attrgetter('properties'), self.tracks.values())), maxlen=0)
+        self.clear_cache()
 
     def add_cov_to_tracks(self, cov):
         """
@@ -154,8 +377,7 @@ class FrameBase(abc.ABC):
         >>> frame.add_cov_to_tracks(highlights)
         >>> assert [track.coverages[0] is highlights for track in frame.tracks.values()]
         """
-        for track in self.tracks.values():
-            track.append_coverage(cov)
+        deque(map(methodcaller('append_coverage', cov), self.tracks.values()), maxlen=0)
 
     def set_tracks_min_max(self, min_, max_, name=None):
         """
@@ -168,12 +390,13 @@ class FrameBase(abc.ABC):
         >>> assert all([track.properties['min_value'] == -10 for track in frame.tracks.values()])
         >>> assert all([track.properties['min_value'] ==  10 for track in frame.tracks.values()])
         """
-        from ..track import BedGraph, BigWig
+        if FrameBase._MINMAX_TYPES is None:
+            FrameBase._MINMAX_TYPES = (_lazy.BedGraph, _lazy.BigWig)
         if name is None:  # set all setable tracks
+            minmax_types = FrameBase._MINMAX_TYPES
             for track in self.tracks.values():
-                if isinstance(track, (BedGraph, BigWig)):
-                    track.properties['min_value'] = min_
-                    track.properties['max_value'] = max_
+                if isinstance(track, minmax_types):
+                    track.properties.update(min_value=min_, max_value=max_)
         else:  # set specified track
             if name not in self.tracks:
                 log.warning("Track {name} not in frame")
@@ -243,47 +466,135 @@ class FrameBase(abc.ABC):
         >>> f + 1 # error operation
         Traceback (most recent call last):
         ...
-        TypeError: unsupported operand type(s) for +: '<class 'coolbox.core.frame.Frame'>' and '<class 'int'>'
+        TypeError: unsupported operand type(s) for +: 'Frame' and 'int'
 
 
         """
-        from ..track.base import Track
-        from ..feature import Feature, FrameFeature
-        from ..coverage.base import Coverage, CoverageStack
-        from ..browser import WidgetsPanel, Browser
+        return self._get_add_handler(other)(self, other)
 
-        result = copy(self)
+    def __iadd__(self, other):
+        """
+        In place version of `+`, operands are added to self without copying the frame.
 
-        if isinstance(other, Track):
-            result.add_track(other)
-            return result
-        elif isinstance(other, FrameBase):
-            for track in other.tracks.values():
-                result.add_track(track)
-            result.properties.update(other.properties)
-            return result
-        elif isinstance(other, FrameFeature):
-            result.properties.update(other.properties)
-            return result
-        elif isinstance(other, Feature):
-            if len(result.tracks) != 0:
-                last = list(result.tracks.values())[-1]
-                last.properties.update(other.properties)
-            return result
-        elif isinstance(other, Coverage):
-            if len(result.tracks) != 0:
-                last = list(result.tracks.values())[-1]
-                last.append_coverage(other)
-            return result
-        elif isinstance(other, CoverageStack):
-            if len(result.tracks) != 0:
-                last = list(result.tracks.values())[-1]
-                last.pile_coverages(other.coverages, pos='top')
-            return result
-        elif isinstance(other, WidgetsPanel):
-            return Browser(self, reference_genome=other.ref, widgets_box=other.type)
-        else:
-            raise TypeError(op_err_msg(self, other))
+        Examples
+        --------
+        >>> from coolbox.api import *
+        >>> f = Frame()
+        >>> f_id = id(f)
+        >>> f += XAxis()
+        >>> f += Color('#66ccff')
+        >>> id(f) == f_id
+        True
+        >>> len(f.tracks)
+        1
+        """
+        return self._get_add_handler(other, op='+=')(self, other, inplace=True)
+
+    def _get_add_handler(self, other, op='+'):
+        handler = FrameBase._resolve_add_handler(type(other))
+        if handler is None:
+            raise TypeError(op_err_msg(self, other, op=op))
+        return handler
+
+    @staticmethod
+    def _resolve_add_handler(type_):
+        """Find the handler of `+` for an operand type, None if the type is not supported."""
+        handlers = FrameBase._get_add_handlers()
+        handler = handlers.get(type_)
+        if handler is None:
+            # resolve by the operand's base classes, then remember it for the exact type.
+            for cls in type_.__mro__:
+                if cls in handlers:
+                    handler = handlers[type_] = handlers[cls]
+                    break
+        return handler
+
+    def _apply_pipeline(self, operands):
+        """
+        Add a sequence of operands to self in place, same as `self += op` for each of them.
+        """
+        result = self
+        for operand in operands:
+            if not isinstance(result, FrameBase):
+                # e.g. a Browser after adding WidgetsPanel, use its own `+` rules.
+                result = result + operand
+            else:
+                result = result._get_add_handler(operand)(result, operand, inplace=True)
+        return result
+
+    @classmethod
+    def _get_add_handlers(cls):
+        """Map operand type to the handler of `__add__`, built on first use to avoid circular imports."""
+        if FrameBase._ADD_HANDLERS is None:
+            FrameBase._ADD_HANDLERS = {
+                _lazy.Track: FrameBase._plus_track,
+                FrameBase: FrameBase._plus_frame,
+                _lazy.FrameFeature: FrameBase._plus_frame_feature,
+                _lazy.Feature: FrameBase._plus_feature,
+                _lazy.Coverage: FrameBase._plus_coverage,
+                _lazy.CoverageStack: FrameBase._plus_coverage_stack,
+                _lazy.WidgetsPanel: FrameBase._plus_widgets_panel,
+            }
+        return FrameBase._ADD_HANDLERS
+
+    def __copy__(self):
+        """
+        Shallow copy without going through the generic copy protocol,
+        the result shares tracks with self but owns a copy of the properties dict.
+        """
+        cls = type(self)
+        result = cls.__new__(cls)
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            for attr in (slots,) if isinstance(slots, str) else slots:
+                if attr not in ('__dict__', '__weakref__') and hasattr(self, attr):
+                    setattr(result, attr, getattr(self, attr))
+        if hasattr(self, '__dict__'):
+            result.__dict__.update(self.__dict__)
+        result.properties = dict(self.properties)
+        return result
+
+    def _plus_track(self, other, inplace=False):
+        result = self if inplace else copy(self)
+        result.add_track(other)
+        return result
+
+    def _plus_frame(self, other, inplace=False):
+        result = self if inplace else copy(self)
+        for track in other.tracks.values():
+            result.add_track(track)
+        result.properties.update(other.properties)
+        return result
+
+    def _plus_frame_feature(self, other, inplace=False):
+        result = self if inplace else copy(self)
+        result.properties.update(other.properties)
+        return result
+
+    def _plus_feature(self, other, inplace=False):
+        result = self if inplace else copy(self)
+        last = result._last_track
+        if last is not None:
+            last.properties.update(other.properties)
+            result.clear_cache()
+        return result
+
+    def _plus_coverage(self, other, inplace=False):
+        result = self if inplace else copy(self)
+        last = result._last_track
+        if last is not None:
+            last.append_coverage(other)
+        return result
+
+    def _plus_coverage_stack(self, other, inplace=False):
+        result = self if inplace else copy(self)
+        last = result._last_track
+        if last is not None:
+            last.pile_coverages(other.coverages, pos='top')
+        return result
+
+    def _plus_widgets_panel(self, other, inplace=False):
+        return _lazy.Browser(self, reference_genome=other.ref, widgets_box=other.type)
 
     def __mul__(self, other):
         """
@@ -304,14 +615,11 @@ class FrameBase(abc.ABC):
         >>> assert all([track.coverages[0] is cov for track in f.tracks.values()])
 
         """
-        from ..coverage.base import Coverage
-        from ..feature import Feature
-
-        if isinstance(other, Coverage):
+        if isinstance(other, _lazy.Coverage):
             result = copy(self)
             result.add_cov_to_tracks(other)
             return result
-        elif isinstance(other, Feature):
+        elif isinstance(other, _lazy.Feature):
             result = copy(self)
             result.add_feature_to_tracks(other)
             return result
@@ -10,7 +10,7 @@ from coolbox.utilities import (
     GenomeRange,
     get_logger,
 )
-from .base import FrameBase
+from .base import FrameBase, _lazy
 
 log = get_logger(__name__)
 
@@ -43,7 +43,8 @@ class Frame(FrameBase):
     Attributes
     ----------
     properties : dict
-        Frame properties dict.
+        Frame properties dict, owned by the frame:
+        copies of the frame (e.g. results of `+` and `*`) get their own properties dict.
 
     tracks : OrderedDict
         Container of all tracks.
@@ -51,6 +52,17 @@ class Frame(FrameBase):
     current_range : GenomeRange, optional
         Current frame range.
 
+    cache_size : int
+        Max number of cached track data, 0 means no cache.
+        Each entry is the data of one track in one range,
+        so caching N ranges of a frame with M tracks needs N * M entries.
+        default FrameBase.DEFAULT_CACHE_SIZE (0).
+        The cache can not see changes of tracks' properties,
+        call `clear_cache` after changing them if the cache is enabled.
+
+    parallel_fetch : bool
+        Fetch data of tracks in a thread pool or not, default True.
+
     Examples
     --------
     >>> frame_1 = Frame()
@@ -68,8 +80,7 @@ class Frame(FrameBase):
 
     def __init__(self, *args, **kwargs):
 
-        tracks = OrderedDict()
-        self._tracks = tracks
+        self.tracks = OrderedDict()
         properties_dict = {
             "width": Frame.DEFAULT_WIDTH,
             "width_ratios": Frame.DEFAULT_WIDTH_RATIOS,
@@ -79,9 +90,30 @@ class Frame(FrameBase):
         properties_dict.update(kwargs)
         super().__init__(properties_dict, *args, **kwargs)
 
-    @property
-    def tracks(self):
-        return self._tracks
+    @classmethod
+    def from_pipeline(cls, operands, **kwargs):
+        """
+        Build a frame from a sequence of `+` operands,
+        same as `Frame(**kwargs) + op1 + op2 + ...` without copying the frame at each step.
+
+        Parameters
+        ----------
+        operands : iterable
+            Tracks, features, coverages ... to be added to the frame in order.
+
+        kwargs : dict
+            Arguments of `Frame`.
+
+        Examples
+        --------
+        >>> from coolbox.api import *
+        >>> frame = Frame.from_pipeline([XAxis(), XAxis(), Color('#66ccff')])
+        >>> len(frame.tracks)
+        2
+        >>> list(frame.tracks.values())[1].properties['color']
+        '#66ccff'
+        """
+        return cls(**kwargs)._apply_pipeline(operands)
 
     def show(self):
         """
@@ -116,9 +148,7 @@ class Frame(FrameBase):
         >>> len(frame.tracks)
         2
         """
-        from ..track.base import Track
-
-        assert isinstance(track, Track), "track must a Track object."
+        assert isinstance(track, _lazy.Track), "track must a Track object."
         if pos == 'tail':
             self.tracks.update({track.name: track})
         else:
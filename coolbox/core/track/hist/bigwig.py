@@ -70,6 +70,17 @@ class BigWig(HistBase):
 
         return intervals
 
+    @property
+    def _backend_key(self):
+        return self.properties['file']
+
+    def _batch_fetch(self, gr: GenomeRange, tracks, **kwargs):
+        """
+        Fetch intervals once for all tracks which read the same bigwig file.
+        """
+        intervals = self.fetch_data(gr, **kwargs)
+        return [intervals] + [intervals.copy() for _ in tracks[1:]]
+
     def get_num_bins(self, default_num=700):
         num_bins = default_num
         if 'number_of_bins' in self.properties:
@@ -15,7 +15,7 @@ def op_err_msg(a, b, op='+'):
     Generate the error message of error operand type.
     """
     return "unsupported operand type(s) for {}: '{}' and '{}'".format(
-        op, str(type(a)), str(type(b))
+        op, type(a).__name__, type(b).__name__
     )
 
 
@@ -69,3 +69,52 @@ def test_frame_compose():
     frame3 = Track({}) + Track({})
     frame = frame1 + frame2 + frame3
     assert len(frame.tracks) == 6
+
+
+def test_frame_iadd():
+    frame = Track({}) + Track({})
+    frame_id = id(frame)
+    frame += Track({})
+    frame += Feature(test="")
+    frame += Coverage({})
+    assert id(frame) == frame_id
+    assert len(frame.tracks) == 3
+    frame += WidgetsPanel()
+    assert isinstance(frame, Browser)
+
+
+def test_frame_from_pipeline():
+    frame = Frame.from_pipeline([Track({}), Track({}), Feature(test="a"), Coverage({})])
+    tracks = list(frame.tracks.values())
+    assert len(tracks) == 2
+    assert tracks[1].properties['test'] == "a"
+    assert len(tracks[1].coverages) == 1
+    assert isinstance(Frame.from_pipeline([Track({}), WidgetsPanel()]), Browser)
+
+
+def test_frame_from_pipeline_after_browser():
+    import pytest
+    with pytest.raises(TypeError):
+        Frame.from_pipeline([Track({}), WidgetsPanel(), Track({})])
+
+
+def test_frame_properties_not_shared():
+    from coolbox.core.feature import FrameTitle
+    frame = Track({}) + Track({})
+    titled = frame + FrameTitle("title")
+    assert titled.properties['title'] == "title"
+    assert frame.properties['title'] == ""
+    frame2 = frame + Track({})
+    frame2 += FrameTitle("title2")
+    assert frame.properties['title'] == ""
+
+
+def test_frame_copy_subclass_slots():
+    class SlotFrame(Frame):
+        __slots__ = ('extra',)
+
+    frame = SlotFrame()
+    frame.extra = "extra"
+    frame2 = frame + Track({})
+    assert isinstance(frame2, SlotFrame)
+    assert frame2.extra == "extra"
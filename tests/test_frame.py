@@ -37,3 +37,125 @@ def test_frame():
     fig = frame.plot(empty_interval)
     tmp = "/tmp/test_coolbox_fig_empty.pdf"
     fig.savefig(tmp)
+
+
+def test_fetch_data_cache():
+    from custom_track import CustomTrack
+
+    class CountTrack(CustomTrack):
+        def __init__(self):
+            super().__init__()
+            self.n_fetch = 0
+
+        def fetch_data(self, gr, **kwargs):
+            self.n_fetch += 1
+            return super().fetch_data(gr, **kwargs)
+
+    track = CountTrack()
+    frame = Frame() + track
+    frame.fetch_data(test_interval)
+    frame.fetch_data(test_interval)
+    assert track.n_fetch == 2  # no cache by default
+
+    track.n_fetch = 0
+    frame.cache_size = 15
+    frame.fetch_data(test_interval)
+    frame.fetch_data(test_interval)
+    assert track.n_fetch == 1
+    frame.fetch_data(empty_interval)
+    assert track.n_fetch == 2
+    frame.clear_cache()
+    frame.fetch_data(test_interval)
+    assert track.n_fetch == 3
+    frame.cache_size = 0
+    frame.fetch_data(test_interval)
+    assert track.n_fetch == 4
+
+
+def test_fetch_data_same_source(monkeypatch):
+    from collections import Counter
+    n_reads = Counter()
+    fetch_data = BigWig.fetch_data
+
+    def count_fetch_data(self, gr, **kwargs):
+        n_reads[self.properties['file']] += 1
+        return fetch_data(self, gr, **kwargs)
+
+    monkeypatch.setattr(BigWig, 'fetch_data', count_fetch_data)
+    bw_file = f"{DATA_DIR}/bigwig_{test_itv}.bw"
+    rna_file = f"{DATA_DIR}/bigwig_{test_itv}_K562_RNA.bigwig"
+    frame = BigWig(bw_file) + BigWig(bw_file, style="line") + XAxis() + BigWig(rna_file) + BigWig(rna_file)
+    data = list(frame.fetch_data(test_interval).values())
+    assert n_reads == {bw_file: 1, rna_file: 1}
+    assert data[0].equals(data[1])
+    assert data[0] is not data[1]
+    assert data[3].equals(data[4])
+
+
+def test_fetch_data_serial():
+    bw_file = f"{DATA_DIR}/bigwig_{test_itv}.bw"
+    frame = BigWig(bw_file) + XAxis() + BigWig(f"{DATA_DIR}/bigwig_{test_itv}_K562_RNA.bigwig")
+    parallel_data = frame.fetch_data(test_interval)
+    frame.parallel_fetch = False
+    serial_data = frame.fetch_data(test_interval)
+    assert list(serial_data) == list(parallel_data)
+    names = list(frame.tracks)
+    assert serial_data[names[0]].equals(parallel_data[names[0]])
+    assert serial_data[names[2]].equals(parallel_data[names[2]])
+    assert str(frame.current_range) == test_interval
+
+
+def test_set_tracks_min_max():
+    bw = BigWig(f"{DATA_DIR}/bigwig_{test_itv}.bw")
+    frame = XAxis() + bw + ABCompartment(f"{DATA_DIR}/bigwig_{test_itv}.bw")
+    frame.set_tracks_min_max(-10, 10)
+    tracks = list(frame.tracks.values())
+    assert 'min_value' not in tracks[0].properties
+    assert all(t.properties['min_value'] == -10 and t.properties['max_value'] == 10 for t in tracks[1:])
+    frame.set_tracks_min_max(0, 1, name=bw.name)
+    assert bw.properties['max_value'] == 1
+
+
+def test_set_tracks_min_max_inserted_track():
+    bw = BigWig(f"{DATA_DIR}/bigwig_{test_itv}.bw")
+    frame = Frame()
+    frame.tracks[bw.name] = bw
+    frame.set_tracks_min_max(-5, 5)
+    assert bw.properties['min_value'] == -5
+
+
+def test_fetch_data_after_add_track():
+    from custom_track import CustomTrack
+    frame = Frame() + CustomTrack()
+    frame.cache_size = 15
+    assert len(frame.fetch_data(test_interval)) == 1
+    frame2 = frame + CustomTrack()
+    assert len(frame2.fetch_data(test_interval)) == 2
+    track = CustomTrack()
+    frame2.tracks[track.name] = track
+    assert list(frame2.fetch_data(test_interval)) == list(frame2.tracks)
+    del frame2.tracks[track.name]
+    assert list(frame2.fetch_data(test_interval)) == list(frame2.tracks)
+
+
+def test_iter_fetch_data():
+    from custom_track import CustomTrack
+    frame = CustomTrack() + CustomTrack()
+    fetched = dict(frame.iter_fetch_data(test_interval))
+    assert list(fetched) == list(frame.tracks)
+    assert fetched == frame.fetch_data(test_interval)
+    import pytest
+    with pytest.raises(ValueError):
+        Frame().iter_fetch_data()
+    frame = Frame()
+    frame.iter_fetch_data(test_interval)
+    assert str(frame.current_range) == test_interval
+
+
+def test_frame_gr2():
+    frame = Frame(gr=test_interval, gr2="chr1:1000-2000")
+    assert str(frame.current_range) == test_interval
+    assert str(frame.current_range2) == "chr1:1000-2000"
+    frame.goto(test_interval, GenomeRange("chr2", 1000, 2000))
+    assert str(frame.current_range) == test_interval
+    assert str(frame.current_range2) == "chr2:1000-2000"